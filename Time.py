@@ -10,29 +10,22 @@ start = datetime(2026, 1, 1, 0, 0)
 now = datetime.now()
 delta = now - start
 total_minutes = int(delta.total_seconds() // 60)
-total_hours = total_minutes // 60
-total_days = total_hours // 24
+total_hours, mn = divmod(total_minutes, 60)
+total_days, h = divmod(total_hours, 24)
 
-months = total_days // 30
-weeks = total_days // 7
+months, days_in_month = divmod(total_days, 30)
+weeks, days_in_week = divmod(total_days, 7)
 
+# Biggest unit first (months or weeks), then days, hours and minutes
 if months >= 1:
-    m = months
-    d = total_days % 30
-    h = total_hours % 24
-    mn = total_minutes % 60
-    print(f"{m} mois {d} jours {h} heures {mn} minutes")
+    parts = [(months, "mois"), (days_in_month, "jours")]
 elif weeks >= 1:
-    w = weeks
-    d = total_days % 7
-    h = total_hours % 24
-    mn = total_minutes % 60
-    print(f"{w} semaines {d} jours {h} heures {mn} minutes")
+    parts = [(weeks, "semaines"), (days_in_week, "jours")]
 else:
-    d = total_days
-    h = total_hours % 24
-    mn = total_minutes % 60
-    print(f"{d} jours {h} heures {mn} minutes")
+    parts = [(total_days, "jours")]
+parts += [(h, "heures"), (mn, "minutes")]
+
+print(" ".join(f"{value} {label}" for value, label in parts if value) or "0 minutes")
 
 print(f"{total_hours} heures")
 
@@ -1,6 +1,23 @@
 import os
 import hashlib
+import mmap
 import shutil
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Hashes are only compared for equality, so use BLAKE3 when it is installed
+# (pip install blake3) and fall back to SHA-256 otherwise
+try:
+    from blake3 import blake3
+
+    HASH_NAME = "blake3"
+
+    def new_hasher():
+        return blake3(max_threads=blake3.AUTO)
+except ImportError:
+    HASH_NAME = "sha256"
+    new_hasher = hashlib.sha256
 
 # Paths - update these to your actual folders
 folder1 = input(r"Path\To\Folder1: ")  # folder with subfolders
@@ -10,38 +27,143 @@ output_folder = input(r"Path\To\Unique_Folder2: ")
 # Create output folder if it doesn't exist
 os.makedirs(output_folder, exist_ok=True)
 
-def hash_file(path):
-    """Return SHA-256 hash of a file"""
-    sha256 = hashlib.sha256()
+# Persistent hash cache so unchanged files are not rehashed on the next run
+# (run with --rescan to throw the cache away)
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "duplicate_hashes.db")
+COMMIT_EVERY = 500  # cached hashes written per commit
+
+os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+cache_db = sqlite3.connect(CACHE_PATH)
+CACHE_TABLE = f"hashes_{HASH_NAME}"  # one table per hash algorithm
+cache_db.execute(
+    f"CREATE TABLE IF NOT EXISTS {CACHE_TABLE} "
+    "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT)"
+)
+if "--rescan" in sys.argv[1:]:
+    cache_db.execute(f"DELETE FROM {CACHE_TABLE}")
+pending_writes = 0
+
+class _HashWriter:
+    """File-like wrapper so shutil.copyfileobj can feed a hash object"""
+    def __init__(self, h):
+        self.h = h
+
+    def write(self, data):
+        self.h.update(data)
+
+# Files at least this big are hashed through mmap instead of read()
+MMAP_THRESHOLD = 10 * 1024 * 1024
+
+def file_key(path, st):
+    """Identify the file behind a path, so hardlinks and overlapping
+    folders (e.g. Folder2 inside Folder1) are only hashed once"""
+    # scandir on Windows reports st_ino as 0; fall back to the full path
+    if st.st_ino:
+        return (st.st_dev, st.st_ino)
+    return os.path.abspath(path)
+
+def hash_files(paths):
+    """Return {path: content hash}, reusing cached values for unchanged files
+
+    Cache lookups and writes stay on this thread; only the actual hashing
+    of cache misses is spread over a thread pool (hashing releases the GIL).
+    """
+    global pending_writes
+    hashes = {}
+    misses = {}  # file_key -> (stat result, all paths pointing at that file)
+    for path in paths:
+        st = file_stats[path]
+        row = cache_db.execute(
+            f"SELECT digest FROM {CACHE_TABLE} WHERE path=? AND size=? AND mtime_ns=?",
+            (os.path.abspath(path), st.st_size, st.st_mtime_ns),
+        ).fetchone()
+        if row:
+            hashes[path] = row[0]
+        else:
+            misses.setdefault(file_key(path, st), (st, []))[1].append(path)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        jobs = list(misses.values())
+        digests = executor.map(lambda job: compute_hash(job[1][0], job[0].st_size), jobs)
+        for (st, same_file), digest in zip(jobs, digests):
+            for path in same_file:
+                hashes[path] = digest
+                cache_db.execute(
+                    f"INSERT OR REPLACE INTO {CACHE_TABLE} VALUES (?, ?, ?, ?)",
+                    (os.path.abspath(path), st.st_size, st.st_mtime_ns, digest),
+                )
+                pending_writes += 1
+                if pending_writes >= COMMIT_EVERY:
+                    cache_db.commit()
+                    pending_writes = 0
+    return hashes
+
+def compute_hash(path, size):
+    """Return content hash of a file"""
+    if size >= MMAP_THRESHOLD:
+        return hash_file_mmap(path)
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        # Python 3.11+ runs the read/update loop in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, new_hasher).hexdigest()
+        hasher = new_hasher()
+        shutil.copyfileobj(f, _HashWriter(hasher), 1 << 20)
+        return hasher.hexdigest()
+
+def hash_file_mmap(path):
+    """Return content hash of a large file by mapping it into memory"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Let the kernel read ahead aggressively (not available on Windows)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        hasher = new_hasher()
+        hasher.update(mm)
+        return hasher.hexdigest()
 
-# Step 1: Scan Folder1 recursively and hash all files
-folder1_hashes = {}
+# Step 1: Scan Folder1 recursively and group files by size
+# (files of different sizes can never be duplicates, so most never get hashed)
+folder1_sizes = {}
+file_stats = {}  # path -> os.stat result, so each file is stat'ed only once
 for root, dirs, files in os.walk(folder1):
     for file in files:
         full_path = os.path.join(root, file)
-        file_hash = hash_file(full_path)
-        folder1_hashes[file_hash] = full_path
+        st = os.stat(full_path)
+        file_stats[full_path] = st
+        folder1_sizes.setdefault(st.st_size, []).append(full_path)
 
-# Step 2: Scan Folder2 and check for duplicates
+# Step 2: Scan Folder2 and hash only files whose size matches something in
+# Folder1, together with those Folder1 candidates
+folder2_files = []
+to_hash = set()
+with os.scandir(folder2) as entries:
+    for entry in entries:
+        if entry.is_file():
+            st = entry.stat()
+            file_stats[entry.path] = st
+            candidates = folder1_sizes.get(st.st_size, [])
+            folder2_files.append((entry.name, entry.path, candidates))
+            if candidates:
+                to_hash.add(entry.path)
+                to_hash.update(candidates)
+
+hashes = hash_files(to_hash)
+
+# Step 3: Check for duplicates
 duplicates = []
 unique_count = 0
 
-for file in os.listdir(folder2):
-    full_path = os.path.join(folder2, file)
-    if os.path.isfile(full_path):
-        file_hash = hash_file(full_path)
-        if file_hash in folder1_hashes:
-            duplicates.append(file)
-        else:
-            # Copy unique files to output folder
-            shutil.copy2(full_path, os.path.join(output_folder, file))
-            unique_count += 1
+for file, full_path, candidates in folder2_files:
+    if candidates and any(hashes[c] == hashes[full_path] for c in candidates):
+        duplicates.append(file)
+    else:
+        # Copy unique files to output folder
+        shutil.copy2(full_path, os.path.join(output_folder, file))
+        unique_count += 1
+
+cache_db.commit()
+cache_db.close()
 
-# Step 3: Print results
+# Step 4: Print results
 if duplicates:
     print("Duplicates found in Folder2 that exist in Folder1:")
     for d in duplicates:
@@ -11,8 +11,11 @@ Usage:
 """
 
 import os
+import re
+import shutil
 import sys
 from datetime import datetime
+from operator import itemgetter
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -46,71 +49,116 @@ def get_folder_path():
             print(f"\n❌ '{path}' is not a valid folder")
             print("Please try again...")
 
+def _make_date(year, month, day):
+    """Build a datetime from digit strings, or None if it is not a real date."""
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+# All supported layouts at the start of a name, matched in one pass:
+# YYYY-MM-DD | DD-MM-YYYY or MM-DD-YYYY | YYYYMMDD
+# (day and month may drop their leading zero when separated by dashes)
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})(?!\d)"
+    r"|(\d{1,2})-(\d{1,2})-(\d{4})(?!\d)"
+    r"|(\d{4})(\d{2})(\d{2})(?!\d)"
+)
+
 def extract_date_from_filename(filename):
     """
     Extract date from filename.
-    Supports formats: 2024-01-15, 15-01-2024, 20240115
+    Supports formats: 2024-01-15, 15-01-2024, 20240115, 01-15-2024
     """
-    date_str = filename[:10]  # Try first 10 characters
-    
-    # Try different date formats
-    formats = [
-        "%Y-%m-%d",  # 2024-01-15
-        "%d-%m-%Y",  # 15-01-2024
-        "%Y%m%d",    # 20240115
-        "%m-%d-%Y",  # 01-15-2024 (US format)
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
+    # Names that don't start with a digit can't hold a date
+    if not filename[:1].isdigit():
+        return None
+    
+    match = _DATE_RE.match(filename)
+    if match:
+        iso_y, iso_m, iso_d, first, second, year, y, m, d = match.groups()
+        if iso_y:
+            return _make_date(iso_y, iso_m, iso_d)
+        if first:
+            # DD-MM-YYYY first, then MM-DD-YYYY
+            return _make_date(year, second, first) or _make_date(year, first, second)
+        return _make_date(y, m, d)
     
     return None
 
+def _collect(folder, extension, exclude=None):
+    """
+    Find files with the given extension in a folder.
+    The file named `exclude` (the merge output) is skipped.
+    Returns (date, filename, path) tuples sorted by date (oldest first).
+    """
+    suffix = f".{extension}"
+    
+    # Filter on the name first (no syscall), then check the type from the
+    # directory entry; the mtime fallback is only looked up for undated names
+    with os.scandir(folder) as entries:
+        files = [
+            (extract_date_from_filename(entry.name)
+             or datetime.fromtimestamp(entry.stat().st_mtime),
+             entry.name,
+             entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(suffix)
+            and entry.name != exclude
+            and entry.is_file()
+        ]
+    
+    files.sort(key=itemgetter(0))
+    return files
+
+def _write_merged(output_file, files, title, separator):
+    """Write files into a single output file, one section per file."""
+    footer = f"\n\n{separator}\n\n".encode()
+    
+    # Binary output: file contents are copied byte for byte, with no decode
+    # and re-encode; a 1 MB buffer turns the many header writes into few disk writes
+    with open(output_file, "wb", buffering=1 << 20) as outfile:
+        outfile.write(f"{title}\n{'=' * 60}\n\n".encode())
+        
+        for i, (date, file, file_path) in enumerate(files, 1):
+            outfile.write(
+                f"File {i:02d}: {file}\nDate: {date:%Y-%m-%d}\n{separator}\n\n".encode()
+            )
+            
+            # Stream in 1 MB chunks
+            try:
+                with open(file_path, "rb") as infile:
+                    shutil.copyfileobj(infile, outfile, 1 << 20)
+            except Exception as e:
+                outfile.write(f"[Error reading {file}: {str(e)}]\n".encode())
+            
+            outfile.write(footer)
+
 # ============================================================================
 # MERGING FUNCTIONS
 # ============================================================================
 
-def merge_python_files():
-    """Merge all Python files in a folder."""
-    print_header("MERGE PYTHON FILES")
-    
-    folder = get_folder_path()
-    
-    # Find all Python files
-    py_files = []
-    for file in os.listdir(folder):
-        if file.lower().endswith(".py"):
-            file_path = os.path.join(folder, file)
-            
-            # Try to extract date from filename
-            date = extract_date_from_filename(file)
-            
-            # If no date in filename, use modification date
-            if not date:
-                mod_time = os.path.getmtime(file_path)
-                date = datetime.fromtimestamp(mod_time)
-            
-            py_files.append((date, file, file_path))
+def _merge(folder, extension, label, output_name, title, separator):
+    """
+    Collect, confirm and merge all files with the given extension.
+    `label` names the file type in messages (e.g. "Python", "text").
+    """
+    # Find files with given extension
+    files = _collect(folder, extension, exclude=output_name)
     
-    if not py_files:
-        print(f"\n❌ No Python files (.py) found in folder")
+    if not files:
+        print(f"\n❌ No {label} files found in folder")
         input("\nPress Enter to continue...")
         return
     
-    # Sort by date (oldest first)
-    py_files.sort(key=lambda x: x[0])
-    
     # Create output file
-    output_file = os.path.join(folder, "merged_python_code.txt")
+    output_file = os.path.join(folder, output_name)
     
-    print(f"\n📁 Found {len(py_files)} Python file(s):")
-    for date, file, _ in py_files:
+    print(f"\n📁 Found {len(files)} {label} file(s):")
+    for date, file, _ in files:
         print(f"   • {file} ({date.strftime('%Y-%m-%d')})")
     
-    print(f"\n📄 Output will be saved as: {os.path.basename(output_file)}")
+    print(f"\n📄 Output will be saved as: {output_name}")
     
     confirm = input("\nMerge these files? (y/n): ").strip().lower()
     if confirm != 'y':
@@ -119,99 +167,25 @@ def merge_python_files():
         return
     
     # Merge files
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        outfile.write("PYTHON CODE MERGER\n")
-        outfile.write("=" * 60 + "\n\n")
-        
-        for i, (date, file, file_path) in enumerate(py_files, 1):
-            outfile.write(f"File {i:02d}: {file}\n")
-            outfile.write(f"Date: {date.strftime('%Y-%m-%d')}\n")
-            outfile.write("=" * 60 + "\n\n")
-            
-            try:
-                with open(file_path, "r", encoding="utf-8") as infile:
-                    content = infile.read()
-                    outfile.write(content)
-            except UnicodeDecodeError:
-                outfile.write(f"[Error: Could not read {file} as UTF-8]\n")
-            except Exception as e:
-                outfile.write(f"[Error reading {file}: {str(e)}]\n")
-            
-            outfile.write("\n\n" + "=" * 60 + "\n\n")
+    _write_merged(output_file, files, title, separator)
     
-    print(f"\n✅ Successfully merged {len(py_files)} Python files!")
+    print(f"\n✅ Successfully merged {len(files)} {label} files!")
     print(f"📄 Output file: {output_file}")
     input("\nPress Enter to continue...")
 
+def merge_python_files():
+    """Merge all Python files in a folder."""
+    print_header("MERGE PYTHON FILES")
+    folder = get_folder_path()
+    _merge(folder, "py", "Python", "merged_python_code.txt",
+           "PYTHON CODE MERGER", "=" * 60)
+
 def merge_text_files():
     """Merge all text files in a folder."""
     print_header("MERGE TEXT FILES")
-    
     folder = get_folder_path()
-    
-    # Find all text files
-    txt_files = []
-    for file in os.listdir(folder):
-        if file.lower().endswith(".txt"):
-            file_path = os.path.join(folder, file)
-            
-            # Try to extract date from filename
-            date = extract_date_from_filename(file)
-            
-            # If no date in filename, use modification date
-            if not date:
-                mod_time = os.path.getmtime(file_path)
-                date = datetime.fromtimestamp(mod_time)
-            
-            txt_files.append((date, file, file_path))
-    
-    if not txt_files:
-        print(f"\n❌ No text files (.txt) found in folder")
-        input("\nPress Enter to continue...")
-        return
-    
-    # Sort by date (oldest first)
-    txt_files.sort(key=lambda x: x[0])
-    
-    # Create output file
-    output_file = os.path.join(folder, "merged_text_files.txt")
-    
-    print(f"\n📁 Found {len(txt_files)} text file(s):")
-    for date, file, _ in txt_files:
-        print(f"   • {file} ({date.strftime('%Y-%m-%d')})")
-    
-    print(f"\n📄 Output will be saved as: {os.path.basename(output_file)}")
-    
-    confirm = input("\nMerge these files? (y/n): ").strip().lower()
-    if confirm != 'y':
-        print("\n❌ Operation cancelled")
-        input("\nPress Enter to continue...")
-        return
-    
-    # Merge files
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        outfile.write("TEXT FILES MERGER\n")
-        outfile.write("=" * 60 + "\n\n")
-        
-        for i, (date, file, file_path) in enumerate(txt_files, 1):
-            outfile.write(f"File {i:02d}: {file}\n")
-            outfile.write(f"Date: {date.strftime('%Y-%m-%d')}\n")
-            outfile.write("-" * 40 + "\n\n")
-            
-            try:
-                with open(file_path, "r", encoding="utf-8") as infile:
-                    content = infile.read()
-                    outfile.write(content)
-            except UnicodeDecodeError:
-                outfile.write(f"[Error: Could not read {file} as UTF-8]\n")
-            except Exception as e:
-                outfile.write(f"[Error reading {file}: {str(e)}]\n")
-            
-            outfile.write("\n\n" + "-" * 40 + "\n\n")
-    
-    print(f"\n✅ Successfully merged {len(txt_files)} text files!")
-    print(f"📄 Output file: {output_file}")
-    input("\nPress Enter to continue...")
+    _merge(folder, "txt", "text", "merged_text_files.txt",
+           "TEXT FILES MERGER", "-" * 40)
 
 def merge_custom_files():
     """Merge files with custom extension."""
@@ -228,69 +202,8 @@ def merge_custom_files():
         input("\nPress Enter to continue...")
         return
     
-    # Find files with given extension
-    custom_files = []
-    for file in os.listdir(folder):
-        if file.lower().endswith(f".{extension}"):
-            file_path = os.path.join(folder, file)
-            
-            # Try to extract date from filename
-            date = extract_date_from_filename(file)
-            
-            # If no date in filename, use modification date
-            if not date:
-                mod_time = os.path.getmtime(file_path)
-                date = datetime.fromtimestamp(mod_time)
-            
-            custom_files.append((date, file, file_path))
-    
-    if not custom_files:
-        print(f"\n❌ No .{extension} files found in folder")
-        input("\nPress Enter to continue...")
-        return
-    
-    # Sort by date (oldest first)
-    custom_files.sort(key=lambda x: x[0])
-    
-    # Create output file
-    output_file = os.path.join(folder, f"merged_{extension}_files.txt")
-    
-    print(f"\n📁 Found {len(custom_files)} .{extension} file(s):")
-    for date, file, _ in custom_files:
-        print(f"   • {file} ({date.strftime('%Y-%m-%d')})")
-    
-    print(f"\n📄 Output will be saved as: {os.path.basename(output_file)}")
-    
-    confirm = input("\nMerge these files? (y/n): ").strip().lower()
-    if confirm != 'y':
-        print("\n❌ Operation cancelled")
-        input("\nPress Enter to continue...")
-        return
-    
-    # Merge files
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        outfile.write(f"{extension.upper()} FILES MERGER\n")
-        outfile.write("=" * 60 + "\n\n")
-        
-        for i, (date, file, file_path) in enumerate(custom_files, 1):
-            outfile.write(f"File {i:02d}: {file}\n")
-            outfile.write(f"Date: {date.strftime('%Y-%m-%d')}\n")
-            outfile.write("-" * 40 + "\n\n")
-            
-            try:
-                with open(file_path, "r", encoding="utf-8") as infile:
-                    content = infile.read()
-                    outfile.write(content)
-            except UnicodeDecodeError:
-                outfile.write(f"[Error: Could not read {file} as UTF-8]\n")
-            except Exception as e:
-                outfile.write(f"[Error reading {file}: {str(e)}]\n")
-            
-            outfile.write("\n\n" + "-" * 40 + "\n\n")
-    
-    print(f"\n✅ Successfully merged {len(custom_files)} .{extension} files!")
-    print(f"📄 Output file: {output_file}")
-    input("\nPress Enter to continue...")
+    _merge(folder, extension, f".{extension}", f"merged_{extension}_files.txt",
+           f"{extension.upper()} FILES MERGER", "-" * 40)
 
 # ============================================================================
 # MAIN MENU
@@ -11,8 +11,18 @@ Usage:
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 
+# pikepdf (qpdf, C++) overlays pages without re-parsing their content
+# streams in Python, so use it when it is installed (pip install pikepdf)
+# and fall back to pure-Python pypdf otherwise
+try:
+    import pikepdf
+    HAVE_PIKEPDF = True
+except ImportError:
+    HAVE_PIKEPDF = False
+
 # ============================================================================
 # UTILITIES
 # ============================================================================
@@ -52,11 +62,11 @@ def check_dependencies():
     except ImportError:
         missing.append("pillow")
     
-    # Check PyPDF2
+    # Check pypdf
     try:
-        import PyPDF2
+        import pypdf
     except ImportError:
-        missing.append("pypdf2")
+        missing.append("pypdf")
     
     # Check reportlab
     try:
@@ -75,56 +85,93 @@ def check_dependencies():
 # TOOL 1: IMAGES TO PDF
 # ============================================================================
 
+# Supported image formats
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp", ".gif")
+
+def folder_images_to_pdf(subfolder_path):
+    """
+    Convert the images in one folder to <folder>.pdf, one page per image.
+    
+    Pages are written one at a time, so only one decoded image is held in
+    memory. Baseline RGB/grayscale JPEGs are embedded as-is, without being
+    decoded at all; other images are converted to RGB and JPEG-encoded.
+    Runs in a worker process, so problems are returned instead of printed.
+    Returns (images_added, warnings).
+    """
+    from io import BytesIO
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.utils import ImageReader
+    
+    subfolder = os.path.basename(subfolder_path)
+    pdf_path = os.path.join(subfolder_path, f"{subfolder}.pdf")
+    with os.scandir(subfolder_path) as entries:
+        files = sorted(entry.name for entry in entries
+                       if entry.name.lower().endswith(IMAGE_EXTS) and entry.is_file())
+    
+    pdf = None  # Only created once an image was read
+    images_added = 0
+    warnings = []
+    
+    for file in files:
+        img_path = os.path.join(subfolder_path, file)
+        try:
+            with Image.open(img_path) as img:
+                width, height = img.size
+                if img.format == "JPEG" and img.mode in ("RGB", "L"):
+                    source = img_path
+                else:
+                    buffer = BytesIO()
+                    img.convert("RGB").save(buffer, "JPEG")
+                    buffer.seek(0)
+                    source = ImageReader(buffer)
+            
+            if pdf is None:
+                pdf = canvas.Canvas(pdf_path)
+            pdf.setPageSize((width, height))
+            pdf.drawImage(source, 0, 0, width, height)
+            pdf.showPage()
+            images_added += 1
+        except Exception as e:
+            warnings.append(f"Skipping {file}: {e}")
+    
+    if pdf is not None:
+        pdf.save()
+    
+    return images_added, warnings
+
 def images_to_pdf():
     """Convert all images in subfolders to PDFs."""
     print_header("IMAGES TO PDF CONVERTER")
     
-    try:
-        from PIL import Image
-    except ImportError:
-        print("\n❌ Pillow is not installed!")
-        print("Install with: pip install pillow")
+    if not check_dependencies():
         input("\nPress Enter to continue...")
         return
     
     root_path = get_folder_path()
     
-    # Supported image formats
-    image_exts = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp", ".gif")
-    
     print(f"\n📁 Processing folder: {os.path.basename(root_path)}")
-    print(f"📁 Supported formats: {', '.join(image_exts)}")
+    print(f"📁 Supported formats: {', '.join(IMAGE_EXTS)}")
     print("\n⏳ Converting images to PDF...")
     print("-" * 50)
     
     total_converted = 0
     
-    # Process each subfolder
-    for subfolder in os.listdir(root_path):
-        subfolder_path = os.path.join(root_path, subfolder)
+    # is_dir() comes from the directory listing itself, no extra stat per entry
+    with os.scandir(root_path) as entries:
+        subfolders = [(entry.name, entry.path) for entry in entries
+                      if entry.is_dir(follow_symlinks=False)]
+    subfolder_paths = [path for _, path in subfolders]
+    
+    # Each subfolder becomes its own PDF, so convert them in parallel
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(folder_images_to_pdf, subfolder_paths)
         
-        if os.path.isdir(subfolder_path):
-            images = []
-            
-            # Collect images
-            for file in sorted(os.listdir(subfolder_path)):
-                if file.lower().endswith(image_exts):
-                    img_path = os.path.join(subfolder_path, file)
-                    try:
-                        img = Image.open(img_path).convert("RGB")
-                        images.append(img)
-                    except Exception as e:
-                        print(f"   ⚠️  Skipping {file}: {e}")
+        for (subfolder, _), (images_added, warnings) in zip(subfolders, results):
+            for warning in warnings:
+                print(f"   ⚠️  {warning}")
             
-            # Create PDF if images found
-            if images:
-                pdf_path = os.path.join(subfolder_path, f"{subfolder}.pdf")
-                images[0].save(
-                    pdf_path,
-                    save_all=True,
-                    append_images=images[1:]
-                )
-                print(f"✅ Created: {subfolder}.pdf ({len(images)} images)")
+            if images_added:
+                print(f"✅ Created: {subfolder}.pdf ({images_added} images)")
                 total_converted += 1
             else:
                 print(f"📭 No images in: {subfolder}")
@@ -134,88 +181,153 @@ def images_to_pdf():
     print(f"   Total PDFs created: {total_converted}")
     input("\nPress Enter to continue...")
 
+def find_subfolder_pdfs(root_path, skip_2up=False):
+    """
+    List the PDFs in each subfolder of root_path.
+    Returns (subfolder, pdf_name, pdf_path) tuples.
+    """
+    found = []
+    with os.scandir(root_path) as subfolders:
+        for subfolder in subfolders:
+            if not subfolder.is_dir(follow_symlinks=False):
+                continue
+            
+            with os.scandir(subfolder.path) as entries:
+                for entry in entries:
+                    pdf = entry.name
+                    if not pdf.lower().endswith(".pdf"):
+                        continue
+                    if skip_2up and pdf.endswith("_2up.pdf"):
+                        continue
+                    found.append((subfolder.name, pdf, entry.path))
+    return found
+
+def run_pdf_jobs(worker, jobs, done_label):
+    """
+    Run worker(pdf_path) for every job in a process pool and print the
+    results grouped by subfolder. Returns (succeeded, failed).
+    """
+    succeeded = 0
+    failed = 0
+    current_folder = None
+    
+    # PDFs are independent, so process them in parallel; map() keeps the
+    # results in submission order for the printout
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(worker, [path for _, _, path in jobs])
+        
+        for (subfolder, pdf, _), (success, error) in zip(jobs, results):
+            if subfolder != current_folder:
+                print(f"\n📂 Folder: {subfolder}")
+                current_folder = subfolder
+            
+            if success:
+                print(f"   ✅ {done_label}: {pdf}")
+                succeeded += 1
+            else:
+                print(f"   ❌ Failed: {pdf} ({error})")
+                failed += 1
+    
+    return succeeded, failed
+
 # ============================================================================
 # TOOL 2: ADD PAGE NUMBERS
 # ============================================================================
 
+def prefetch(path):
+    """
+    Ask the OS to start reading the whole file into the page cache, so
+    qpdf's scattered object reads don't each wait on the disk.
+    Only a hint: does nothing where posix_fadvise is missing (Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+def page_number_overlay(page_sizes):
+    """
+    Draw every page number into one overlay PDF (one page per page),
+    so reportlab and the PDF parser only run once per document.
+    Returns the overlay as a BytesIO.
+    """
+    from reportlab.pdfgen import canvas
+    from io import BytesIO
+    
+    packet = BytesIO()
+    c = canvas.Canvas(packet)
+    for i, (page_width, page_height) in enumerate(page_sizes):
+        c.setPageSize((page_width, page_height))
+        c.setFont("Helvetica-Bold", 28)
+        c.drawCentredString(
+            page_width / 2,
+            50,  # Position from bottom
+            str(i + 1)
+        )
+        c.showPage()
+    c.save()
+    packet.seek(0)
+    return packet
+
+def number_pdf(pdf_path):
+    """Add page numbers to a single PDF."""
+    try:
+        if HAVE_PIKEPDF:
+            prefetch(pdf_path)
+            with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+                sizes = []
+                for page in pdf.pages:
+                    x0, y0, x1, y1 = (float(v) for v in page.mediabox)
+                    sizes.append((x1 - x0, y1 - y0))
+                
+                with pikepdf.open(page_number_overlay(sizes)) as numbers:
+                    for page, number in zip(pdf.pages, numbers.pages):
+                        page.add_overlay(number)
+                    pdf.save(pdf_path)
+            return True, None
+        
+        from pypdf import PdfReader, PdfWriter
+        
+        reader = PdfReader(pdf_path)
+        overlay = PdfReader(page_number_overlay(
+            (float(page.mediabox.width), float(page.mediabox.height))
+            for page in reader.pages
+        ))
+        
+        # Merge page numbers
+        writer = PdfWriter()
+        for page, number in zip(reader.pages, overlay.pages):
+            page.merge_page(number)
+            writer.add_page(page)
+        
+        # Save with numbers
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+        
+        return True, None
+        
+    except Exception as e:
+        return False, str(e)
+
 def add_page_numbers():
     """Add page numbers to PDFs in subfolders."""
     print_header("ADD PAGE NUMBERS TO PDFS")
     
-    try:
-        from PyPDF2 import PdfReader, PdfWriter
-        from reportlab.pdfgen import canvas
-        from io import BytesIO
-    except ImportError:
-        print("\n❌ Required packages not installed!")
-        print("Install with: pip install pypdf2 reportlab")
+    if not check_dependencies():
         input("\nPress Enter to continue...")
         return
     
     root_path = get_folder_path()
     
-    def process_pdf(pdf_path):
-        """Add page numbers to a single PDF."""
-        try:
-            reader = PdfReader(pdf_path)
-            writer = PdfWriter()
-            
-            for i, page in enumerate(reader.pages):
-                packet = BytesIO()
-                page_width = float(page.mediabox.width)
-                page_height = float(page.mediabox.height)
-                
-                # Create canvas for page number
-                c = canvas.Canvas(packet, pagesize=(page_width, page_height))
-                c.setFont("Helvetica-Bold", 28)
-                c.drawCentredString(
-                    page_width / 2,
-                    50,  # Position from bottom
-                    str(i + 1)
-                )
-                c.save()
-                
-                # Merge page number
-                packet.seek(0)
-                overlay = PdfReader(packet)
-                page.merge_page(overlay.pages[0])
-                writer.add_page(page)
-            
-            # Save with numbers
-            with open(pdf_path, "wb") as f:
-                writer.write(f)
-            
-            return True, None
-            
-        except Exception as e:
-            return False, str(e)
-    
     print(f"\n📁 Processing folder: {os.path.basename(root_path)}")
     print("\n⏳ Adding page numbers...")
     print("-" * 50)
     
-    total_numbered = 0
-    total_failed = 0
-    
-    # Process each subfolder
-    for subfolder in os.listdir(root_path):
-        subfolder_path = os.path.join(root_path, subfolder)
-        
-        if os.path.isdir(subfolder_path):
-            pdfs = [f for f in os.listdir(subfolder_path) if f.lower().endswith(".pdf")]
-            
-            if pdfs:
-                print(f"\n📂 Folder: {subfolder}")
-                for pdf in pdfs:
-                    pdf_path = os.path.join(subfolder_path, pdf)
-                    success, error = process_pdf(pdf_path)
-                    
-                    if success:
-                        print(f"   ✅ Numbered: {pdf}")
-                        total_numbered += 1
-                    else:
-                        print(f"   ❌ Failed: {pdf} ({error})")
-                        total_failed += 1
+    jobs = find_subfolder_pdfs(root_path)
+    total_numbered, total_failed = run_pdf_jobs(number_pdf, jobs, "Numbered")
     
     print("-" * 50)
     print(f"\n✅ Page numbering complete!")
@@ -227,98 +339,98 @@ def add_page_numbers():
 # TOOL 3: CREATE 2-UP LAYOUT
 # ============================================================================
 
+def make_2up_pikepdf(pdf_path, out_path):
+    """2-up layout with pikepdf: source pages are placed as form XObjects."""
+    from reportlab.lib.pagesizes import A4
+    
+    page_width, page_height = A4
+    
+    def place(sheet, page, y):
+        # Half-size box at the left edge, same as scaling by 0.5
+        x0, y0, x1, y1 = (float(v) for v in page.mediabox)
+        sheet.add_overlay(page, pikepdf.Rectangle(
+            0, y, (x1 - x0) / 2, y + (y1 - y0) / 2))
+    
+    prefetch(pdf_path)
+    with pikepdf.open(pdf_path) as src, pikepdf.new() as out:
+        # Index the pages: iterating src.pages twice at once (for + next)
+        # would walk two separate iterators
+        pages = list(src.pages)
+        for i in range(0, len(pages), 2):
+            sheet = out.add_blank_page(page_size=(page_width, page_height))
+            place(sheet, pages[i], page_height / 2)  # top half
+            if i + 1 < len(pages):
+                place(sheet, pages[i + 1], 0)  # bottom half
+        
+        out.save(out_path)
+
+def make_2up(pdf_path):
+    """Convert a PDF to 2-up layout."""
+    try:
+        out_path = pdf_path.replace(".pdf", "_2up.pdf")
+        
+        if HAVE_PIKEPDF:
+            make_2up_pikepdf(pdf_path, out_path)
+            return True, None
+        
+        from pypdf import PdfReader, PdfWriter, PageObject, Transformation
+        from reportlab.lib.pagesizes import A4
+        
+        reader = PdfReader(pdf_path)
+        writer = PdfWriter()
+        
+        page_width, page_height = A4
+        
+        # Scale each page by half as it is merged instead of scaling the
+        # source page in place, and keep only the pending top-half page
+        top = Transformation().scale(0.5).translate(0, page_height / 2)
+        bottom = Transformation().scale(0.5)
+        
+        pending = None
+        for page in reader.pages:
+            if pending is None:
+                pending = page
+                continue
+            
+            # Create new A4 page: first page on top, second on the bottom
+            new_page = PageObject.create_blank_page(width=page_width, height=page_height)
+            new_page.merge_transformed_page(pending, top)
+            new_page.merge_transformed_page(page, bottom)
+            writer.add_page(new_page)
+            pending = None
+        
+        # Odd page count: the last page goes on top of its own sheet
+        if pending is not None:
+            new_page = PageObject.create_blank_page(width=page_width, height=page_height)
+            new_page.merge_transformed_page(pending, top)
+            writer.add_page(new_page)
+        
+        # Save 2-up version
+        with open(out_path, "wb") as f:
+            writer.write(f)
+        
+        return True, None
+        
+    except Exception as e:
+        return False, str(e)
+
 def create_2up_pdfs():
     """Create 2-up layout PDFs (2 pages per sheet)."""
     print_header("CREATE 2-UP PDF LAYOUTS")
     
-    try:
-        from PyPDF2 import PdfReader, PdfWriter, PageObject
-        from reportlab.lib.pagesizes import A4
-    except ImportError:
-        print("\n❌ Required packages not installed!")
-        print("Install with: pip install pypdf2 reportlab")
+    if not check_dependencies():
         input("\nPress Enter to continue...")
         return
     
     root_path = get_folder_path()
     
-    def make_2up(pdf_path):
-        """Convert a PDF to 2-up layout."""
-        try:
-            reader = PdfReader(pdf_path)
-            writer = PdfWriter()
-            
-            page_width, page_height = A4
-            pages = reader.pages
-            
-            i = 0
-            while i < len(pages):
-                # Create new A4 page
-                new_page = PageObject.create_blank_page(
-                    width=page_width,
-                    height=page_height
-                )
-                
-                # First page (top half)
-                p1 = pages[i]
-                p1.scale_by(0.5)
-                new_page.merge_translated_page(
-                    p1,
-                    0,
-                    page_height / 2
-                )
-                
-                # Second page (bottom half) if exists
-                if i + 1 < len(pages):
-                    p2 = pages[i + 1]
-                    p2.scale_by(0.5)
-                    new_page.merge_translated_page(
-                        p2,
-                        0,
-                        0
-                    )
-                
-                writer.add_page(new_page)
-                i += 2
-            
-            # Save 2-up version
-            out_path = pdf_path.replace(".pdf", "_2up.pdf")
-            with open(out_path, "wb") as f:
-                writer.write(f)
-            
-            return True, None
-            
-        except Exception as e:
-            return False, str(e)
-    
     print(f"\n📁 Processing folder: {os.path.basename(root_path)}")
     print("\n⏳ Creating 2-up layouts...")
     print("-" * 50)
     
-    total_converted = 0
-    total_failed = 0
-    
-    # Process each subfolder
-    for subfolder in os.listdir(root_path):
-        subfolder_path = os.path.join(root_path, subfolder)
-        
-        if os.path.isdir(subfolder_path):
-            # Get PDFs that aren't already 2-up
-            pdfs = [f for f in os.listdir(subfolder_path) 
-                   if f.lower().endswith(".pdf") and not f.endswith("_2up.pdf")]
-            
-            if pdfs:
-                print(f"\n📂 Folder: {subfolder}")
-                for pdf in pdfs:
-                    pdf_path = os.path.join(subfolder_path, pdf)
-                    success, error = make_2up(pdf_path)
-                    
-                    if success:
-                        print(f"   ✅ 2-up created: {pdf}")
-                        total_converted += 1
-                    else:
-                        print(f"   ❌ Failed: {pdf} ({error})")
-                        total_failed += 1
+    # Get PDFs that aren't already 2-up
+    jobs = find_subfolder_pdfs(root_path, skip_2up=True)
+    total_converted, total_failed = run_pdf_jobs(make_2up, jobs, "2-up created")
     
     print("-" * 50)
     print(f"\n✅ 2-up conversion complete!")
@@ -406,10 +518,11 @@ def show_about():
     
     print("🔧 Required Packages:")
     print("   • Pillow - Image processing")
-    print("   • PyPDF2 - PDF manipulation")
+    print("   • pypdf - PDF manipulation")
     print("   • ReportLab - PDF generation")
+    print("   • pikepdf - optional, faster numbering and 2-up")
     print()
-    print("   Install with: pip install pillow pypdf2 reportlab")
+    print("   Install with: pip install pillow pypdf reportlab")
     print()
     
     input("Press Enter to continue...")
@@ -13,17 +13,77 @@ Usage:
 """
 
 import os
+import re
 import sys
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import cv2
+import numpy as np
 
 # ============================================================================
 # CONFIGURATION & UTILITIES
 # ============================================================================
 
-SUPPORTED_EXTENSIONS = (".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv", ".MOV", ".MP4")
+SUPPORTED_EXTENSIONS = (".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv")  # compared lowercased
+VIDEO_EXTENSION_SET = frozenset(SUPPORTED_EXTENSIONS)
 crop_settings = {"x": 0, "y": 0, "w": 0, "h": 0}  # Will be set by user
 
+# Parallel FFmpeg workers: one per core for re-encodes, fewer for stream
+# copies which are limited by the disk rather than the CPU
+MAX_WORKERS = os.cpu_count() or 1
+COPY_WORKERS = min(4, MAX_WORKERS)
+MAX_BATCH = 16  # videos cropped by a single FFmpeg process
+# Hardware encoders allow only a few encode sessions at once (consumer
+# NVIDIA drivers cap NVENC at 5-8), and every output of a batch opens one
+HW_WORKERS = 2
+HW_BATCH = 2
+
+# H.264 encoders used for cropping, fastest first. Hardware encoders are
+# only used if a test encode succeeds; set VIDEOTOOLBOX_ENCODER to force one.
+ENCODER_ENV = "VIDEOTOOLBOX_ENCODER"
+VIDEO_ENCODERS = {
+    "h264_nvenc": {
+        "global": [],
+        "input": ["-hwaccel", "cuda"],
+        "filters": "",
+        "output": ["-c:v", "h264_nvenc", "-preset", "p4"],
+    },
+    "h264_qsv": {
+        "global": [],
+        "input": [],
+        "filters": "",
+        "output": ["-c:v", "h264_qsv", "-preset", "veryfast"],
+    },
+    "h264_videotoolbox": {
+        "global": [],
+        "input": [],
+        "filters": "",
+        "output": ["-c:v", "h264_videotoolbox", "-b:v", "8M"],
+    },
+    "h264_vaapi": {
+        "global": ["-vaapi_device", "/dev/dri/renderD128"],
+        "input": [],
+        "filters": "format=nv12,hwupload",
+        "output": ["-c:v", "h264_vaapi"],
+    },
+    "libx264": {
+        "global": [],
+        "input": [],
+        "filters": "",
+        "output": ["-c:v", "libx264", "-preset", "veryfast"],
+    },
+    # Containers that can't hold H.264 get FFmpeg's default for the container
+    "default": {
+        "global": [],
+        "input": [],
+        "filters": "",
+        "output": [],
+    },
+}
+NON_H264_EXTENSIONS = (".webm",)  # compared lowercased
+
 def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -46,8 +106,9 @@ def wait_continue():
     """Wait for user to press Enter."""
     input("\n↵ Press Enter to continue...")
 
+@lru_cache(maxsize=None)
 def check_ffmpeg():
-    """Check if FFmpeg is available."""
+    """Check if FFmpeg is available (checked once per session)."""
     try:
         subprocess.run(["ffmpeg", "-version"], 
                       stdout=subprocess.DEVNULL, 
@@ -107,18 +168,416 @@ def get_file_path(prompt):
             print(f"\n❌ '{path}' is not a valid file")
             print("Please make sure the file exists and try again...")
 
+def run_ffmpeg(cmd):
+    """Run an FFmpeg command quietly and return its exit code."""
+    try:
+        result = subprocess.run(cmd,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL,
+                                check=False)
+        return result.returncode
+    except OSError:
+        return -1
+
+@lru_cache(maxsize=None)
+def ffmpeg_codecs(kind):
+    """Return the names of all "encoders" or "decoders" this FFmpeg build includes."""
+    try:
+        result = subprocess.run(["ffmpeg", "-hide_banner", f"-{kind}"],
+                                capture_output=True, text=True, check=False)
+    except OSError:
+        return frozenset()
+    # Codec lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    return frozenset(line.split()[1] for line in result.stdout.splitlines()
+                     if len(line.split()) > 1 and line.startswith(" "))
+
+def encoder_works(name):
+    """Check that FFmpeg can actually encode with the given encoder."""
+    settings = VIDEO_ENCODERS[name]
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        *settings["global"],
+        "-f", "lavfi",
+        "-i", "color=size=256x256",
+        "-frames:v", "1",
+        "-vf", settings["filters"] or "null",
+        *settings["output"],
+        "-f", "null",
+        "-"
+    ]
+    return run_ffmpeg(cmd) == 0
+
+@lru_cache(maxsize=None)
+def pick_video_encoder():
+    """Return the name of the fastest working H.264 encoder."""
+    forced = os.environ.get(ENCODER_ENV, "").strip()
+    if forced in VIDEO_ENCODERS:
+        return forced
+    
+    # Only test-encode with hardware encoders that are compiled in;
+    # being listed doesn't mean the GPU/driver is actually there
+    compiled = ffmpeg_codecs("encoders")
+    for name in ("h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_vaapi"):
+        if name in compiled and encoder_works(name):
+            return name
+    return "libx264"
+
+def probe_video(path):
+    """Return ffprobe's key=value info for the first video stream ({} on failure)."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries",
+        "stream=codec_name,width,height,coded_width,coded_height,field_order"
+        ":stream_tags=rotate:stream_side_data=rotation:format=start_time",
+        "-of", "default=noprint_wrappers=1",
+        path
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except OSError:
+        return {}
+    
+    info = {}
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            info[key] = value
+    return info
+
+def video_encoder(output_path):
+    """Return the encoder used for an output file, based on its container."""
+    if output_path.lower().endswith(NON_H264_EXTENSIONS):
+        return "default"
+    return pick_video_encoder()
+
+def crop_filter(encoder):
+    """Return the crop filter chain for the given encoder."""
+    crop = f"crop={crop_settings['w']}:{crop_settings['h']}:{crop_settings['x']}:{crop_settings['y']}"
+    extra = VIDEO_ENCODERS[encoder]["filters"]
+    return f"{crop},{extra}" if extra else crop
+
+def encoder_threads(threads):
+    """FFmpeg arguments limiting encoder threads (0 = FFmpeg's default)."""
+    return ["-threads", str(threads)] if threads else []
+
+def cuda_crop_input(input_path):
+    """Input options that decode and crop on the GPU (NVDEC), or None.
+    
+    The cuvid decoders crop while decoding, so frames stay in video
+    memory all the way to NVENC.
+    """
+    info = probe_video(input_path)
+    decoder = f"{info.get('codec_name')}_cuvid"
+    if decoder not in ffmpeg_codecs("decoders"):
+        return None
+    
+    try:
+        width = int(info["width"])
+        height = int(info["height"])
+        rotated = any(float(info.get(key) or 0) for key in ("TAG:rotate", "rotation"))
+    except (KeyError, ValueError):
+        return None
+    if rotated:  # Rotating needs the frames back in system memory
+        return None
+    
+    x, y = crop_settings['x'], crop_settings['y']
+    right = width - x - crop_settings['w']
+    bottom = height - y - crop_settings['h']
+    if right < 0 or bottom < 0:
+        return None
+    
+    return ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda",
+            "-c:v", decoder, "-crop", f"{y}x{bottom}x{x}x{right}"]
+
+def crop_input(input_path, encoder, gpu_decode=True):
+    """Return the (input options, video filter) pair that crops one video."""
+    if encoder == "h264_nvenc" and gpu_decode:
+        gpu_input = cuda_crop_input(input_path)
+        if gpu_input:
+            return gpu_input, "null"
+    return VIDEO_ENCODERS[encoder]["input"], crop_filter(encoder)
+
+def crop_command(input_path, output_path, threads=0, gpu_decode=True):
+    """Build the FFmpeg command that crops one video."""
+    encoder = video_encoder(output_path)
+    settings = VIDEO_ENCODERS[encoder]
+    input_options, video_filter = crop_input(input_path, encoder, gpu_decode)
+    return [
+        "ffmpeg",
+        "-y",
+        *settings["global"],
+        *input_options,
+        "-i", input_path,
+        "-vf", video_filter,
+        *settings["output"],
+        *encoder_threads(threads),
+        "-c:a", "copy",
+        output_path
+    ]
+
+def crop_batch_command(jobs, threads=0):
+    """Build one FFmpeg command that crops several videos.
+    
+    jobs is a list of (input_path, output_path) pairs whose outputs all
+    use the same encoder (see video_encoder).
+    """
+    encoder = video_encoder(jobs[0][1])
+    settings = VIDEO_ENCODERS[encoder]
+    cmd = ["ffmpeg", "-y", *settings["global"]]
+    filters = []
+    for input_path, _ in jobs:
+        input_options, video_filter = crop_input(input_path, encoder)
+        cmd += [*input_options, "-i", input_path]
+        filters.append(video_filter)
+    
+    graph = ";".join(f"[{i}:v]{vf}[v{i}]" for i, vf in enumerate(filters))
+    cmd += ["-filter_complex", graph]
+    
+    for i, (_, output_path) in enumerate(jobs):
+        cmd += ["-map", f"[v{i}]", "-map", f"{i}:a?", *settings["output"],
+                *encoder_threads(threads), "-c:a", "copy", output_path]
+    return cmd
+
+def crop_batch(jobs, threads=0):
+    """Crop a batch of videos in one FFmpeg process.
+    
+    Falls back to one process per video if the batch fails, so a single
+    broken file does not fail the others. Returns a list of booleans.
+    """
+    if len(jobs) > 1 and run_ffmpeg(crop_batch_command(jobs, threads)) == 0:
+        return [True] * len(jobs)
+    
+    results = []
+    for input_path, output_path in jobs:
+        ok = run_ffmpeg(crop_command(input_path, output_path, threads)) == 0
+        # NVDEC can't decode every profile; retry with a CPU decode and crop
+        if not ok and video_encoder(output_path) == "h264_nvenc":
+            cmd = crop_command(input_path, output_path, threads, gpu_decode=False)
+            ok = run_ffmpeg(cmd) == 0
+        results.append(ok)
+    return results
+
+# Bitstream filters that can rewrite the cropping fields of a stream
+CROP_BSF = {"h264": "h264_metadata", "hevc": "hevc_metadata"}
+# Coded sizes are whole blocks: H.264 macroblocks are 16x16 (32 rows for
+# interlaced video), HEVC sizes are multiples of the 8x8 minimum block
+CODED_ALIGN = {"h264": 16, "hevc": 8}
+
+def coded_size(info):
+    """Return the (width, height) a video is actually coded at.
+    
+    ffprobe doesn't decode a frame, so for H.264 it reports the display
+    size as the coded size (1080 rows instead of 1088 for 1080p).
+    """
+    align_w = align_h = CODED_ALIGN[info["codec_name"]]
+    if info["codec_name"] == "h264" and info.get("field_order") in ("tt", "bb", "tb", "bt"):
+        align_h = 32
+    width = int(info["coded_width"])
+    height = int(info["coded_height"])
+    return -(-width // align_w) * align_w, -(-height // align_h) * align_h
+
+def has_crop_size(path):
+    """Check that a cropped video really has the crop's width and height."""
+    info = probe_video(path)
+    return (info.get("width") == str(crop_settings['w'])
+            and info.get("height") == str(crop_settings['h']))
+
+def lossless_crop_command(input_path, output_path):
+    """Build an FFmpeg command that crops without re-encoding.
+    
+    The crop is written into the H.264/HEVC cropping fields and the video
+    is stream-copied. Returns None if the video or crop area can't be
+    cropped this way.
+    """
+    info = probe_video(input_path)
+    bsf = CROP_BSF.get(info.get("codec_name"))
+    if not bsf:
+        return None
+    
+    try:
+        # Crop offsets count from the coded size (e.g. 1088 rows for 1080p)
+        coded_w, coded_h = coded_size(info)
+        rotated = any(float(info.get(key) or 0) for key in ("TAG:rotate", "rotation"))
+    except (KeyError, ValueError):
+        return None
+    if rotated:  # Crop coordinates were picked on the rotated picture
+        return None
+    
+    x, y = crop_settings['x'], crop_settings['y']
+    right = coded_w - x - crop_settings['w']
+    bottom = coded_h - y - crop_settings['h']
+    
+    # Offsets are stored in whole chroma samples (rows in pairs of fields
+    # for interlaced video), so only even columns and every 4th row work
+    if right < 0 or bottom < 0 or x % 2 or right % 2 or y % 4 or bottom % 4:
+        return None
+    
+    return [
+        "ffmpeg",
+        "-y",
+        "-i", input_path,
+        "-c", "copy",
+        "-bsf:v", f"{bsf}=crop_left={x}:crop_right={right}:crop_top={y}:crop_bottom={bottom}",
+        output_path
+    ]
+
+def lossless_crop(input_path, output_path, threads=0):
+    """Crop one video without re-encoding, re-encoding only if that fails.
+    
+    Returns [ok] so results can be handled like crop_batch's.
+    """
+    cmd = lossless_crop_command(input_path, output_path)
+    if cmd and run_ffmpeg(cmd) == 0 and has_crop_size(output_path):
+        return [True]
+    return crop_batch([(input_path, output_path)], threads)
+
+def ask_lossless_crop():
+    """Explain the lossless crop and ask whether to use it."""
+    print("\n⚡ Fast crop: no re-encoding, no quality loss, done in seconds.")
+    print("   The area outside the crop stays in the file; players just hide it.")
+    return input("Use fast crop where possible? (y/n): ").strip().lower() == 'y'
+
+# A clip typed as START-END, each time as [[hours:]minutes:]seconds[.fraction]
+_TIME = r"\d+(?::\d{1,2}){0,2}(?:\.\d+)?"
+CLIP_SPAN_RE = re.compile(rf"({_TIME})\s*-\s*({_TIME})")
+
+def parse_clip_span(text):
+    """Parse "1:30-2:05" style input into (start, end) seconds, or None."""
+    match = CLIP_SPAN_RE.fullmatch(text)
+    if not match:
+        return None
+    
+    times = []
+    for stamp in match.groups():
+        seconds = 0.0
+        for part in stamp.split(":"):
+            seconds = seconds * 60 + float(part)
+        times.append(seconds)
+    return tuple(times)
+
+def keyframe_before(input_path, seconds):
+    """Return the time of the last video keyframe at or before `seconds`.
+    
+    Only the packets around that point are read. Returns `seconds`
+    unchanged if no keyframe could be found.
+    """
+    # ffprobe works in the file's own timestamps, while FFmpeg's -ss counts
+    # from the start of the file (e.g. MPEG-TS often starts at 1.4 s)
+    try:
+        offset = float(probe_video(input_path).get("start_time") or 0)
+    except ValueError:  # "N/A"
+        offset = 0
+    target = seconds + offset
+    
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-read_intervals", f"{max(0, target - 10)}%{target + 0.001}",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        input_path
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except OSError:
+        return seconds
+    
+    best = None
+    for line in result.stdout.splitlines():
+        pts, _, flags = line.partition(",")
+        try:
+            pts = float(pts)
+        except ValueError:  # "N/A"
+            continue
+        if "K" in flags and pts <= target and (best is None or pts > best):
+            best = pts
+    return seconds if best is None else max(0, best - offset)
+
+def snap_clip(input_path, start, duration, output_path):
+    """Move a clip's start back to a keyframe, keeping its end time.
+    
+    A stream copy can only start on a keyframe; starting anywhere else
+    gives a frozen or black lead-in that many players stumble over.
+    """
+    keyframe = keyframe_before(input_path, start)
+    return keyframe, duration + (start - keyframe), output_path
+
+def clip_command(input_path, start, duration, output_path):
+    """Build the FFmpeg command that stream-copies one clip."""
+    return [
+        "ffmpeg",
+        "-y",
+        "-ss", str(start),
+        "-i", input_path,
+        "-t", str(duration),
+        "-c", "copy",
+        "-avoid_negative_ts", "make_zero",
+        output_path
+    ]
+
+def clip_batch_command(input_path, clips):
+    """Build one FFmpeg command that cuts several clips from one video.
+    
+    clips is a list of (start, duration, output_path) tuples. The video is
+    opened once per clip so every clip keeps its fast seek to the start.
+    """
+    cmd = ["ffmpeg", "-y"]
+    for start, _, _ in clips:
+        cmd += ["-ss", str(start), "-i", input_path]
+    for i, (_, duration, output_path) in enumerate(clips):
+        cmd += ["-map", f"{i}:v:0", "-map", f"{i}:a:0?", "-t", str(duration),
+                "-c", "copy", "-avoid_negative_ts", "make_zero", output_path]
+    return cmd
+
+def clip_batch(input_path, clips):
+    """Cut all clips of one video in a single FFmpeg process.
+    
+    Falls back to one process per clip if the batch fails.
+    Returns a list of booleans.
+    """
+    clips = [snap_clip(input_path, *clip) for clip in clips]
+    if len(clips) > 1 and run_ffmpeg(clip_batch_command(input_path, clips)) == 0:
+        return [True] * len(clips)
+    return [run_ffmpeg(clip_command(input_path, *clip)) == 0 for clip in clips]
+
 def find_videos_in_folder(folder_path):
     """Find all video files in a folder."""
-    videos = []
-    for file in os.listdir(folder_path):
-        if file.lower().endswith(SUPPORTED_EXTENSIONS):
-            videos.append(file)
-    return sorted(videos)
+    # The file type comes from the directory listing, no extra stat per file
+    with os.scandir(folder_path) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSION_SET
+            and entry.is_file()
+        )
 
 # ============================================================================
 # STEP 1: INTERACTIVE CROP COORDINATE FINDER
 # ============================================================================
 
+def open_video_capture(video_file):
+    """Open a video for previewing, with hardware decoding where possible.
+    
+    Uses OpenCV's FFmpeg backend with any available hardware decoder
+    (NVDEC, VAAPI, D3D11, ...); falls back to OpenCV's default backend.
+    """
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):  # OpenCV 4.5.2+
+        cap = cv2.VideoCapture(video_file, cv2.CAP_FFMPEG,
+                               [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(video_file)
+
+def points_to_rect(p1, p2):
+    """Return (left, top, width, height) of the rectangle spanned by two corners."""
+    (x1, y1), (x2, y2) = p1, p2
+    left, top = min(x1, x2), min(y1, y2)
+    return left, top, max(x1, x2) - left, max(y1, y2) - top
+
 def find_crop_coordinates():
     """Interactive tool to visually find crop coordinates."""
     print_header("STEP 1: FIND CROP COORDINATES")
@@ -137,7 +596,7 @@ def find_crop_coordinates():
     video_file = get_file_path("Which video do you want to use as reference?")
     
     # Open video
-    cap = cv2.VideoCapture(video_file)
+    cap = open_video_capture(video_file)
     if not cap.isOpened():
         print(f"\n❌ Could not open video: {os.path.basename(video_file)}")
         print("Please make sure it's a valid video file.")
@@ -147,39 +606,56 @@ def find_crop_coordinates():
     # Get video info
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    if not fps or fps != fps or fps > 240:  # missing, NaN or bogus metadata
+        fps = 30
+    # Show at most ~30 frames per second; on 50/60 fps videos the frames in
+    # between are only grabbed, skipping their conversion to BGR images
+    show_every = max(1, round(fps / 30))
+    frame_interval = show_every / fps
     
     print(f"\n✅ Video loaded: {os.path.basename(video_file)}")
     print(f"   Resolution: {width} x {height}")
     print(f"   Full path: {video_file}")
     
-    points = []
+    # Show (and draw on) a copy no bigger than 1280x720; clicks are mapped
+    # back to the full resolution when they are reported and saved
+    scale = min(1280 / width, 720 / height, 1.0) if width and height else 1.0
+    preview_w = max(1, round(width * scale))
+    preview_h = max(1, round(height * scale))
+    
+    def to_preview(image):
+        if scale == 1.0:
+            return image
+        return cv2.resize(image, (preview_w, preview_h), interpolation=cv2.INTER_AREA)
+    
+    def to_source(point):
+        return (min(width, round(point[0] / scale)), min(height, round(point[1] / scale)))
+    
+    points = []  # In preview coordinates
+    redraw = True  # Set whenever the paused view needs repainting
     
     def mouse_callback(event, x, y, flags, param):
+        nonlocal redraw
         if event == cv2.EVENT_LBUTTONDOWN and len(points) < 2:
             points.append((x, y))
-            print(f"\n📍 Point {len(points)} selected: ({x}, {y})")
+            redraw = True
+            print(f"\n📍 Point {len(points)} selected: {to_source((x, y))}")
             
             if len(points) == 2:
                 # Calculate rectangle
-                x1, y1 = points[0]
-                x2, y2 = points[1]
-                left = min(x1, x2)
-                top = min(y1, y2)
-                right = max(x1, x2)
-                bottom = max(y1, y2)
-                width = right - left
-                height = bottom - top
+                left, top, w, h = points_to_rect(to_source(points[0]), to_source(points[1]))
                 
                 print("\n" + "="*50)
                 print("🎯 CROP AREA FOUND!")
                 print(f"   Top-left corner:     ({left}, {top})")
-                print(f"   Bottom-right corner: ({right}, {bottom})")
-                print(f"   Dimensions:          {width} x {height} pixels")
+                print(f"   Bottom-right corner: ({left + w}, {top + h})")
+                print(f"   Dimensions:          {w} x {h} pixels")
                 print("="*50)
     
     # Create window
     cv2.namedWindow("Video - Select Crop Area", cv2.WINDOW_NORMAL)
-    cv2.resizeWindow("Video - Select Crop Area", min(width, 1280), min(height, 720))
+    cv2.resizeWindow("Video - Select Crop Area", preview_w, preview_h)
     cv2.setMouseCallback("Video - Select Crop Area", mouse_callback)
     
     print("\n" + "-"*50)
@@ -193,40 +669,75 @@ def find_crop_coordinates():
     print("\n⏳ Loading video...")
     
     paused = False
+    scratch = None  # Reused buffer for drawing over the paused frame
     
     while True:
+        frame_start = time.perf_counter()
+        
         if not paused:
+            for _ in range(show_every - 1):
+                cap.grab()
             ret, frame = cap.read()
             if not ret:
                 cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                 ret, frame = cap.read()
+            # Each frame is a fresh buffer, so draw on it directly
+            frame = to_preview(frame)
+            display = frame
+        elif redraw:
+            # The paused frame is shown again and again, keep it clean
+            # and draw on a copy in a buffer that is allocated only once
+            if scratch is None or scratch.shape != frame.shape:
+                scratch = np.empty_like(frame)
+            np.copyto(scratch, frame)
+            display = scratch
+        else:
+            # Paused and nothing changed: the window already shows the right image
+            display = None
         
-        display = frame.copy()
-        
-        # Draw rectangle if we have 2 points
-        if len(points) == 2:
-            cv2.rectangle(display, points[0], points[1], (0, 255, 0), 2)
-            cv2.putText(display, "Crop Area Selected", (10, 30),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        
-        # Draw instructions on screen
-        status = "PAUSED" if paused else "PLAYING"
-        cv2.putText(display, f"Status: {status}", (10, height - 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0) if not paused else (0, 0, 255), 2)
-        
-        # Draw selected points count
-        cv2.putText(display, f"Points: {len(points)}/2", (width - 150, 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-        
-        cv2.imshow("Video - Select Crop Area", display)
+        if display is not None:
+            # Draw rectangle if we have 2 points
+            if len(points) == 2:
+                cv2.rectangle(display, points[0], points[1], (0, 255, 0), 2)
+                cv2.putText(display, "Crop Area Selected", (10, 30),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            
+            # Draw instructions on screen
+            status = "PAUSED" if paused else "PLAYING"
+            cv2.putText(display, f"Status: {status}", (10, preview_h - 40),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0) if not paused else (0, 0, 255), 2)
+            
+            # Draw selected points count
+            cv2.putText(display, f"Points: {len(points)}/2", (preview_w - 150, 30),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+            
+            cv2.imshow("Video - Select Crop Area", display)
+            redraw = False
         
-        key = cv2.waitKey(30 if not paused else 1) & 0xFF
+        # While paused, just wait for input; clicks still get picked up
+        # within 100 ms (waitKey(0) would ignore them until a key is pressed).
+        # While playing, only wait for what is left of the frame interval
+        # after decoding and drawing, so playback runs at the video's speed
+        if paused:
+            delay = 100
+        else:
+            elapsed = time.perf_counter() - frame_start
+            delay = max(1, int((frame_interval - elapsed) * 1000))
+        key = cv2.waitKey(delay) & 0xFF
         
         if key == 32:  # SPACE
             paused = not paused
+            redraw = True
+            if paused:
+                # The current frame already has the overlay drawn on it,
+                # so fetch a clean copy of it from the decoder
+                ret, clean = cap.retrieve()
+                if ret:
+                    frame = to_preview(clean)
             print(f"\n⏸️  Video {'paused' if paused else 'playing'}")
         elif key == ord('r'):  # R
-            points = []
+            points.clear()
+            redraw = True
             print("\n🔄 Points reset")
         elif key == 27:  # ESC
             break
@@ -235,13 +746,9 @@ def find_crop_coordinates():
     cv2.destroyAllWindows()
     
     if len(points) == 2:
-        # Save coordinates
-        x1, y1 = points[0]
-        x2, y2 = points[1]
-        crop_settings['x'] = min(x1, x2)
-        crop_settings['y'] = min(y1, y2)
-        crop_settings['w'] = abs(x2 - x1)
-        crop_settings['h'] = abs(y2 - y1)
+        # Save coordinates (in full-resolution pixels)
+        rect = points_to_rect(to_source(points[0]), to_source(points[1]))
+        crop_settings['x'], crop_settings['y'], crop_settings['w'], crop_settings['h'] = rect
         
         print("\n✅ Crop coordinates saved!")
         print(f"   x: {crop_settings['x']}")
@@ -309,16 +816,13 @@ def crop_single_video():
         wait_continue()
         return
     
-    show_progress(2, 2, "Cropping video...")
+    cmd = lossless_crop_command(video_file, output_path)
+    fast = cmd is not None and ask_lossless_crop()
+    if not fast:
+        cmd = crop_command(video_file, output_path)
+    fallback = crop_command(video_file, output_path, gpu_decode=False)
     
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i", video_file,
-        "-vf", f"crop={crop_settings['w']}:{crop_settings['h']}:{crop_settings['x']}:{crop_settings['y']}",
-        "-c:a", "copy",
-        output_path
-    ]
+    show_progress(2, 2, "Cropping video...")
     
     try:
         print(f"\n⏳ Processing...")
@@ -327,6 +831,15 @@ def crop_single_video():
                               stderr=subprocess.PIPE,
                               text=True)
         
+        # The GPU decoder can't handle every profile (and the fast crop not
+        # every stream); retry with a plain CPU decode and crop
+        failed = result.returncode != 0 or (fast and not has_crop_size(output_path))
+        if failed and cmd != fallback:
+            result = subprocess.run(fallback,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE,
+                                  text=True)
+        
         if result.returncode == 0:
             print(f"\n✅ Success! Cropped video saved as:")
             print(f"   {output_path}")
@@ -371,33 +884,64 @@ def crop_folder_videos():
         wait_continue()
         return
     
+    # Videos whose crop fits the codec's cropping fields can skip re-encoding;
+    # only ask about it if at least one video qualifies
+    lossless = [video for video in videos
+                if lossless_crop_command(os.path.join(folder_path, video),
+                                         os.path.join(output_folder, video))]
+    if lossless:
+        print(f"\n   {len(lossless)}/{len(videos)} video(s) can use the fast crop")
+        if not ask_lossless_crop():
+            lossless = []
+    to_encode = [video for video in videos if video not in lossless]
+    
     show_progress(2, 3, "Cropping videos...")
     
+    # Group videos so each FFmpeg process crops several of them, but never
+    # so many per batch that some workers are left without work. A batch
+    # only holds videos encoded the same way (e.g. WebM can't use H.264)
+    by_encoder = {}
+    for video in to_encode:
+        encoder = video_encoder(os.path.join(output_folder, video))
+        by_encoder.setdefault(encoder, []).append(video)
+    
+    workers, max_batch = MAX_WORKERS, MAX_BATCH
+    if pick_video_encoder() != "libx264":
+        workers, max_batch = min(HW_WORKERS, MAX_WORKERS), HW_BATCH
+    batch_size = max(1, min(max_batch, -(-len(to_encode) // workers)))
+    batches = [group[i:i + batch_size]
+               for group in by_encoder.values()
+               for i in range(0, len(group), batch_size)]
+    
+    # libx264 starts about one thread per core for every encode; with many
+    # encodes running at once, share the cores out instead of oversubscribing
+    threads = 0
+    if len(to_encode) > 1 and pick_video_encoder() == "libx264":
+        threads = max(1, MAX_WORKERS // min(len(to_encode), MAX_WORKERS))
+    
+    print(f"\n⏳ Running up to {workers} FFmpeg job(s) at once...")
+    
     success_count = 0
-    for i, video in enumerate(videos, 1):
-        input_path = os.path.join(folder_path, video)
-        output_path = os.path.join(output_folder, video)
-        
-        print(f"\n[{i}/{len(videos)}] Processing: {video}")
-        
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-i", input_path,
-            "-vf", f"crop={crop_settings['w']}:{crop_settings['h']}:{crop_settings['x']}:{crop_settings['y']}",
-            "-c:a", "copy",
-            output_path
-        ]
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        jobs = {}
+        for video in lossless:
+            future = executor.submit(lossless_crop, os.path.join(folder_path, video),
+                                     os.path.join(output_folder, video), threads)
+            jobs[future] = [video]
+        for batch in batches:
+            pairs = [(os.path.join(folder_path, video), os.path.join(output_folder, video))
+                     for video in batch]
+            jobs[executor.submit(crop_batch, pairs, threads)] = batch
         
-        try:
-            subprocess.run(cmd, 
-                         stdout=subprocess.DEVNULL,
-                         stderr=subprocess.DEVNULL,
-                         check=True)
-            print(f"   ✅ Success")
-            success_count += 1
-        except:
-            print(f"   ❌ Failed")
+        for future in as_completed(jobs):
+            for video, ok in zip(jobs[future], future.result()):
+                done += 1
+                if ok:
+                    print(f"   [{done}/{len(videos)}] ✅ {video}")
+                    success_count += 1
+                else:
+                    print(f"   [{done}/{len(videos)}] ❌ {video}")
     
     show_progress(3, 3, "Complete!")
     
@@ -438,6 +982,9 @@ def clip_videos():
     print(f"\n📁 Found {len(videos)} video(s)")
     print(f"📁 Clips will be saved to: {output_folder}")
     
+    # Collect every clip first, then extract them all in parallel
+    clips = {}  # input_path -> [(output_name, (start, duration, output_path))]
+    
     for video in videos:
         print(f"\n{'='*50}")
         print(f"Processing: {video}")
@@ -450,57 +997,58 @@ def clip_videos():
         
         while True:
             print(f"\n--- Clip {clip_count} from '{video}' ---")
-            print("Enter timing in MINUTES and SECONDS")
+            print("Enter START-END as [hours:]minutes:seconds, e.g. 1:30-2:05")
             print("(Press Enter to skip this video)")
             
-            start_min = input("Start minute: ").strip()
-            if start_min == "":
+            span = input("Clip: ").strip()
+            if span == "":
                 print(f"Skipping {video}")
                 break
             
-            try:
-                start_min = int(start_min)
-                start_sec = int(input("Start second: "))
-                end_min = int(input("End minute: "))
-                end_sec = int(input("End second: "))
-                
-                start_time = start_min * 60 + start_sec
-                end_time = end_min * 60 + end_sec
-                duration = end_time - start_time
-                
-                if duration <= 0:
-                    print("❌ End time must be after start time")
-                    continue
-                
-                output_name = f"{name}_clip{clip_count}{ext}"
-                output_path = os.path.join(output_folder, output_name)
-                
-                print(f"\n⏳ Extracting clip {clip_count}...")
-                
-                cmd = [
-                    "ffmpeg",
-                    "-y",
-                    "-ss", str(start_time),
-                    "-i", input_path,
-                    "-t", str(duration),
-                    "-c", "copy",
-                    output_path
-                ]
-                
-                subprocess.run(cmd, 
-                             stdout=subprocess.DEVNULL,
-                             stderr=subprocess.DEVNULL)
-                
-                print(f"✅ Saved: {output_name}")
-                clip_count += 1
-                
-                another = input("\nExtract another clip from this video? (y/n): ").strip().lower()
-                if another != 'y':
-                    break
-                    
-            except ValueError:
-                print("❌ Please enter valid numbers")
+            times = parse_clip_span(span)
+            if times is None:
+                print("❌ Please enter the clip like 1:30-2:05")
+                continue
+            
+            start_time, end_time = times
+            duration = end_time - start_time
+            
+            if duration <= 0:
+                print("❌ End time must be after start time")
                 continue
+            
+            output_name = f"{name}_clip{clip_count}{ext}"
+            output_path = os.path.join(output_folder, output_name)
+            
+            clips.setdefault(input_path, []).append(
+                (output_name, (start_time, duration, output_path)))
+            
+            print(f"📝 Queued: {output_name}")
+            clip_count += 1
+            
+            another = input("\nExtract another clip from this video? (y/n): ").strip().lower()
+            if another != 'y':
+                break
+    
+    if clips:
+        total = sum(len(video_clips) for video_clips in clips.values())
+        print(f"\n⏳ Extracting {total} clip(s)...")
+        
+        # One FFmpeg process per video cuts all of its clips; stream copies
+        # are disk-bound, so keep the worker count low
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            jobs = {}
+            for input_path, video_clips in clips.items():
+                future = executor.submit(clip_batch, input_path,
+                                         [clip for _, clip in video_clips])
+                jobs[future] = [output_name for output_name, _ in video_clips]
+            
+            for future in as_completed(jobs):
+                for output_name, ok in zip(jobs[future], future.result()):
+                    if ok:
+                        print(f"✅ Saved: {output_name}")
+                    else:
+                        print(f"❌ Failed: {output_name}")
     
     print(f"\n{'='*50}")
     print("✅ Clipping complete!")
@@ -569,6 +1117,8 @@ def view_settings():
     
     print(f"\n🔧 Tools Available:")
     print("   ✓ FFmpeg: " + ("Installed" if check_ffmpeg() else "Not found"))
+    if check_ffmpeg():
+        print(f"   ✓ Video encoder: {pick_video_encoder()}")
     print(f"   ✓ Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}")
     
     wait_continue()